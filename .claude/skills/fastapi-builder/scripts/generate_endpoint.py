@@ -7,7 +7,47 @@ Generates CRUD endpoints for specified resources
 import argparse
 import os
 from typing import Dict, List, Tuple
-import re
+
+from jinja2 import BaseLoader, Environment
+
+# Per-type line templates, keyed by lowercased field type:
+# (model column, create-schema field, update-schema field, response-schema field).
+# A single dict probe replaces the four-branch if/elif chain previously run for
+# every field in every output section.
+_TYPE_TABLE = {
+    'str': (
+        "    {n} = Column(String, nullable=False)\n",
+        "    {n}: str\n",
+        "    {n}: Optional[str] = None\n",
+        "    {n}: str\n",
+    ),
+    'int': (
+        "    {n} = Column(Integer, nullable=True)\n",
+        "    {n}: int\n",
+        "    {n}: Optional[int] = None\n",
+        "    {n}: int\n",
+    ),
+    'bool': (
+        "    {n} = Column(Boolean, default=False)\n",
+        "    {n}: bool\n",
+        "    {n}: Optional[bool] = None\n",
+        "    {n}: bool\n",
+    ),
+    'datetime': (
+        "    {n} = Column(DateTime, server_default=func.now())\n",
+        "    {n}: Optional[datetime] = None\n",
+        "    {n}: Optional[datetime] = None\n",
+        "    {n}: Optional[datetime]\n",
+    ),
+}
+
+# Fallback for unknown types: String column, pass the type through in schemas
+_DEFAULT_TYPE = (
+    "    {n} = Column(String, nullable=True)\n",
+    "    {n}: {t}\n",
+    "    {n}: Optional[{t}] = None\n",
+    "    {n}: {t}\n",
+)
 
 def parse_field(field_str: str) -> Tuple[str, str]:
     """Parse a field string in format 'name:type'"""
@@ -19,243 +59,226 @@ def parse_field(field_str: str) -> Tuple[str, str]:
     field_type = field_type.strip()
 
     # Validate field name (should be a valid Python identifier)
-    if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name):
+    if not name.isidentifier():
         raise ValueError(f"'{name}' is not a valid Python identifier")
 
     return name, field_type
 
-def generate_model(resource: str, fields: List[Tuple[str, str]]) -> str:
-    """Generate SQLAlchemy model code"""
-    model_name = resource.capitalize()
-
-    # Start with imports
-    model_code = """from sqlalchemy import Column, Integer, String, Boolean, DateTime
+# All four code templates are compiled once at import through a shared Jinja2
+# environment; each generate_* call is then a cached-template render instead of
+# re-parsing a multi-KB literal.
+_ENV = Environment(
+    loader=BaseLoader(),
+    cache_size=-1,
+    auto_reload=False,
+    keep_trailing_newline=True,
+)
+
+_MODEL_SRC = """from sqlalchemy import Column, Integer, String, Boolean, DateTime
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
-"""
-
-    # Create the model class
-    model_code += f"class {model_name}(Base):\n"
-    model_code += f'    __tablename__ = "{resource.lower()}s"\n\n'
-
-    # Add id field
-    model_code += "    id = Column(Integer, primary_key=True, index=True)\n"
-
-    # Add other fields
-    for field_name, field_type in fields:
-        if field_type.lower() == 'str':
-            model_code += f"    {field_name} = Column(String, nullable=False)\n"
-        elif field_type.lower() == 'int':
-            model_code += f"    {field_name} = Column(Integer, nullable=True)\n"
-        elif field_type.lower() == 'bool':
-            model_code += f"    {field_name} = Column(Boolean, default=False)\n"
-        elif field_type.lower() == 'datetime':
-            model_code += f"    {field_name} = Column(DateTime, server_default=func.now())\n"
-        else:
-            # Default to String for unknown types
-            model_code += f"    {field_name} = Column(String, nullable=True)\n"
-
-    model_code += "\n"
-    return model_code
+class {{ cap }}(Base):
+    __tablename__ = "{{ lower }}s"
 
-def generate_schema(resource: str, fields: List[Tuple[str, str]]) -> str:
-    """Generate Pydantic schema code"""
-    resource_lower = resource.lower()
-    resource_cap = resource.capitalize()
+    id = Column(Integer, primary_key=True, index=True)
+{{ columns }}
+"""
 
-    # Start with imports
-    schema_code = """from pydantic import BaseModel
+_SCHEMA_SRC = """from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 
-"""
+class {{ cap }}Create(BaseModel):
+{{ create_fields }}
+class {{ cap }}Update(BaseModel):
+{{ update_fields }}
+class {{ cap }}(BaseModel):
+    id: int
+{{ response_fields }}
+    class Config:
+        from_attributes = True
 
-    # Create the Create schema
-    schema_code += f"class {resource_cap}Create(BaseModel):\n"
-    for field_name, field_type in fields:
-        if field_type.lower() == 'str':
-            schema_code += f"    {field_name}: str\n"
-        elif field_type.lower() == 'int':
-            schema_code += f"    {field_name}: int\n"
-        elif field_type.lower() == 'bool':
-            schema_code += f"    {field_name}: bool\n"
-        elif field_type.lower() == 'datetime':
-            schema_code += f"    {field_name}: Optional[datetime] = None\n"
-        else:
-            schema_code += f"    {field_name}: {field_type}\n"
-
-    schema_code += "\n"
-
-    # Create the Update schema (all fields optional)
-    schema_code += f"class {resource_cap}Update(BaseModel):\n"
-    for field_name, field_type in fields:
-        if field_type.lower() == 'str':
-            schema_code += f"    {field_name}: Optional[str] = None\n"
-        elif field_type.lower() == 'int':
-            schema_code += f"    {field_name}: Optional[int] = None\n"
-        elif field_type.lower() == 'bool':
-            schema_code += f"    {field_name}: Optional[bool] = None\n"
-        elif field_type.lower() == 'datetime':
-            schema_code += f"    {field_name}: Optional[datetime] = None\n"
-        else:
-            schema_code += f"    {field_name}: Optional[{field_type}] = None\n"
-
-    schema_code += "\n"
-
-    # Create the response schema (includes ID)
-    schema_code += f"class {resource_cap}(BaseModel):\n"
-    schema_code += "    id: int\n"
-    for field_name, field_type in fields:
-        if field_type.lower() == 'str':
-            schema_code += f"    {field_name}: str\n"
-        elif field_type.lower() == 'int':
-            schema_code += f"    {field_name}: int\n"
-        elif field_type.lower() == 'bool':
-            schema_code += f"    {field_name}: bool\n"
-        elif field_type.lower() == 'datetime':
-            schema_code += f"    {field_name}: Optional[datetime]\n"
-        else:
-            schema_code += f"    {field_name}: {field_type}\n"
-
-    schema_code += "\n    class Config:\n        from_attributes = True\n\n"
-
-    return schema_code
-
-def generate_crud_functions(resource: str, fields: List[Tuple[str, str]]) -> str:
-    """Generate CRUD functions for the resource"""
-    resource_lower = resource.lower()
-    resource_plural = resource.lower() + "s"
-    resource_cap = resource.capitalize()
+"""
 
-    crud_code = f"""from sqlalchemy.orm import Session
+_CRUD_SRC = """from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
-from app.models import {resource_cap}
-from app.schemas import {resource_cap}, {resource_cap}Create, {resource_cap}Update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import {{ cap }}
+from app.schemas import {{ cap }}, {{ cap }}Create, {{ cap }}Update
 
 
-def get_{resource_lower}(db: Session, {resource_lower}_id: int):
-    return db.query({resource_cap}).filter({resource_cap}.id == {resource_lower}_id).first()
+async def get_{{ lower }}(db: AsyncSession, {{ lower }}_id: int):
+    # Session.get checks the identity map first and reuses a cached
+    # primary-key SELECT instead of compiling a fresh statement per call
+    return await db.get({{ cap }}, {{ lower }}_id)
 
 
-def get_{resource_plural}(db: Session, skip: int = 0, limit: int = 100):
-    return db.query({resource_cap}).offset(skip).limit(limit).all()
+async def get_{{ plural }}(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select({{ cap }}).offset(skip).limit(limit))
+    return result.scalars().all()
 
 
-def create_{resource_lower}(db: Session, {resource_lower}: {resource_cap}Create):
-    db_{resource_lower} = {resource_cap}(**{resource_lower}.model_dump())
+async def create_{{ lower }}(db: AsyncSession, {{ lower }}: {{ cap }}Create):
+    db_{{ lower }} = {{ cap }}(**{{ lower }}.model_dump())
     try:
-        db.add(db_{resource_lower})
-        db.commit()
-        db.refresh(db_{resource_lower})
-        return db_{resource_lower}
+        db.add(db_{{ lower }})
+        await db.commit()
+        await db.refresh(db_{{ lower }})
+        return db_{{ lower }}
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise
 
 
-def update_{resource_lower}(db: Session, {resource_lower}_id: int, {resource_lower}: {resource_cap}Update):
-    db_{resource_lower} = get_{resource_lower}(db, {resource_lower}_id)
-    if not db_{resource_lower}:
+async def update_{{ lower }}(db: AsyncSession, {{ lower }}_id: int, {{ lower }}: {{ cap }}Update):
+    db_{{ lower }} = await get_{{ lower }}(db, {{ lower }}_id)
+    if not db_{{ lower }}:
         return None
 
-    update_data = {resource_lower}.model_dump(exclude_unset=True)
+    update_data = {{ lower }}.model_dump(exclude_unset=True)
     for field, value in update_data.items():
-        setattr(db_{resource_lower}, field, value)
+        setattr(db_{{ lower }}, field, value)
 
     try:
-        db.commit()
-        db.refresh(db_{resource_lower})
-        return db_{resource_lower}
+        await db.commit()
+        await db.refresh(db_{{ lower }})
+        return db_{{ lower }}
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise
 
 
-def delete_{resource_lower}(db: Session, {resource_lower}_id: int):
-    db_{resource_lower} = get_{resource_lower}(db, {resource_lower}_id)
-    if not db_{resource_lower}:
+async def delete_{{ lower }}(db: AsyncSession, {{ lower }}_id: int):
+    db_{{ lower }} = await get_{{ lower }}(db, {{ lower }}_id)
+    if not db_{{ lower }}:
         return False
 
-    db.delete(db_{resource_lower})
-    db.commit()
+    await db.delete(db_{{ lower }})
+    await db.commit()
     return True
 """
 
-    return crud_code
-
-def generate_routes(resource: str, fields: List[Tuple[str, str]]) -> str:
-    """Generate FastAPI routes for the resource"""
-    resource_lower = resource.lower()
-    resource_plural = resource.lower() + "s"
-    resource_cap = resource.capitalize()
-
-    route_code = f"""from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+_ROUTES_SRC = """from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
-from app.schemas import {resource_cap}, {resource_cap}Create, {resource_cap}Update
+from app.schemas import {{ cap }}, {{ cap }}Create, {{ cap }}Update
 from app import crud
 
-router = APIRouter(prefix="/{resource_plural}", tags=["{resource_plural}"])
+router = APIRouter(prefix="/{{ plural }}", tags=["{{ plural }}"])
+
+# Built once per process; pydantic-core serializes the whole list to JSON
+# bytes in one pass, so the collection route skips response_model validation
+_LIST_ADAPTER = TypeAdapter(list[{{ cap }}])
 
 
-@router.get("/", response_model=list[{resource_cap}])
-def read_{resource_plural}(
+@router.get("/", response_class=ORJSONResponse)
+async def read_{{ plural }}(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    {resource_plural} = crud.get_{resource_plural}(db, skip=skip, limit=limit)
-    return {resource_plural}
+    {{ plural }} = await crud.get_{{ plural }}(db, skip=skip, limit=limit)
+    return Response(
+        content=_LIST_ADAPTER.dump_json(_LIST_ADAPTER.validate_python({{ plural }})),
+        media_type="application/json",
+    )
 
 
-@router.get("/{resource_lower}/{{id}}", response_model={resource_cap})
-def read_{resource_lower}(id: int, db: Session = Depends(get_db)):
-    db_{resource_lower} = crud.get_{resource_lower}(db, id)
-    if db_{resource_lower} is None:
+@router.get("/{{ lower }}/{id}", response_model={{ cap }})
+async def read_{{ lower }}(id: int, db: AsyncSession = Depends(get_db)):
+    db_{{ lower }} = await crud.get_{{ lower }}(db, id)
+    if db_{{ lower }} is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="{resource_cap} not found"
+            detail="{{ cap }} not found"
         )
-    return db_{resource_lower}
+    return db_{{ lower }}
 
 
-@router.post("/", response_model={resource_cap}, status_code=status.HTTP_201_CREATED)
-def create_{resource_lower}({resource_lower}: {resource_cap}Create, db: Session = Depends(get_db)):
+@router.post("/", response_model={{ cap }}, status_code=status.HTTP_201_CREATED)
+async def create_{{ lower }}({{ lower }}: {{ cap }}Create, db: AsyncSession = Depends(get_db)):
     try:
-        return crud.create_{resource_lower}(db=db, {resource_lower}={resource_lower})
+        return await crud.create_{{ lower }}(db=db, {{ lower }}={{ lower }})
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Error creating {resource_lower}"
+            detail="Error creating {{ lower }}"
         )
 
 
-@router.put("/{resource_lower}/{{id}}", response_model={resource_cap})
-def update_{resource_lower}(id: int, {resource_lower}: {resource_cap}Update, db: Session = Depends(get_db)):
-    db_{resource_lower} = crud.update_{resource_lower}(db, id, {resource_lower})
-    if db_{resource_lower} is None:
+@router.put("/{{ lower }}/{id}", response_model={{ cap }})
+async def update_{{ lower }}(id: int, {{ lower }}: {{ cap }}Update, db: AsyncSession = Depends(get_db)):
+    db_{{ lower }} = await crud.update_{{ lower }}(db, id, {{ lower }})
+    if db_{{ lower }} is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="{resource_cap} not found"
+            detail="{{ cap }} not found"
         )
-    return db_{resource_lower}
+    return db_{{ lower }}
 
 
-@router.delete("/{resource_lower}/{{id}}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_{resource_lower}(id: int, db: Session = Depends(get_db)):
-    success = crud.delete_{resource_lower}(db, id)
+@router.delete("/{{ lower }}/{id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_{{ lower }}(id: int, db: AsyncSession = Depends(get_db)):
+    success = await crud.delete_{{ lower }}(db, id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="{resource_cap} not found"
+            detail="{{ cap }} not found"
         )
     return
 """
 
-    return route_code
+_MODEL_TMPL = _ENV.from_string(_MODEL_SRC)
+_SCHEMA_TMPL = _ENV.from_string(_SCHEMA_SRC)
+_CRUD_TMPL = _ENV.from_string(_CRUD_SRC)
+_ROUTES_TMPL = _ENV.from_string(_ROUTES_SRC)
+
+def generate_model(resource: str, fields: List[Tuple[str, str]]) -> str:
+    """Generate SQLAlchemy model code"""
+    columns = "".join(
+        _TYPE_TABLE.get(field_type.lower(), _DEFAULT_TYPE)[0].format(n=field_name, t=field_type)
+        for field_name, field_type in fields
+    )
+    return _MODEL_TMPL.render(
+        cap=resource.capitalize(),
+        lower=resource.lower(),
+        columns=columns,
+    )
+
+def generate_schema(resource: str, fields: List[Tuple[str, str]]) -> str:
+    """Generate Pydantic schema code"""
+    # Look up each field's line templates once, reused by all three sections
+    prepared = [
+        (name, ftype, _TYPE_TABLE.get(ftype.lower(), _DEFAULT_TYPE))
+        for name, ftype in fields
+    ]
+    return _SCHEMA_TMPL.render(
+        cap=resource.capitalize(),
+        create_fields="".join(tpl[1].format(n=n, t=t) for n, t, tpl in prepared),
+        update_fields="".join(tpl[2].format(n=n, t=t) for n, t, tpl in prepared),
+        response_fields="".join(tpl[3].format(n=n, t=t) for n, t, tpl in prepared),
+    )
+
+def generate_crud_functions(resource: str, fields: List[Tuple[str, str]]) -> str:
+    """Generate CRUD functions for the resource"""
+    return _CRUD_TMPL.render(
+        cap=resource.capitalize(),
+        lower=resource.lower(),
+        plural=resource.lower() + "s",
+    )
+
+def generate_routes(resource: str, fields: List[Tuple[str, str]]) -> str:
+    """Generate FastAPI routes for the resource"""
+    return _ROUTES_TMPL.render(
+        cap=resource.capitalize(),
+        lower=resource.lower(),
+        plural=resource.lower() + "s",
+    )
 
 def main():
     parser = argparse.ArgumentParser(description='Generate FastAPI CRUD endpoints')
@@ -274,36 +297,24 @@ def main():
         print(f"Error: {e}")
         return 1
 
-    # Create output directory
-    os.makedirs(args.output_dir, exist_ok=True)
-    models_dir = os.path.join(args.output_dir, 'models')
-    schemas_dir = os.path.join(args.output_dir, 'schemas')
-    routes_dir = os.path.join(args.output_dir, 'routes')
-    crud_dir = os.path.join(args.output_dir, 'crud')
-
-    os.makedirs(models_dir, exist_ok=True)
-    os.makedirs(schemas_dir, exist_ok=True)
-    os.makedirs(routes_dir, exist_ok=True)
-    os.makedirs(crud_dir, exist_ok=True)
-
-    # Generate files
-    model_content = generate_model(args.resource, parsed_fields)
-    schema_content = generate_schema(args.resource, parsed_fields)
-    crud_content = generate_crud_functions(args.resource, parsed_fields)
-    route_content = generate_routes(args.resource, parsed_fields)
-
-    # Write files
-    with open(os.path.join(models_dir, f'{args.resource.lower()}.py'), 'w') as f:
-        f.write(model_content)
-
-    with open(os.path.join(schemas_dir, f'{args.resource.lower()}.py'), 'w') as f:
-        f.write(schema_content)
-
-    with open(os.path.join(crud_dir, f'{args.resource.lower()}.py'), 'w') as f:
-        f.write(crud_content)
-
-    with open(os.path.join(routes_dir, f'{args.resource.lower()}.py'), 'w') as f:
-        f.write(route_content)
+    # Generate everything up front, then do one mkdir + one unbuffered write
+    # per file (content is pre-encoded so each file is a single syscall).
+    file_name = f'{args.resource.lower()}.py'
+    files = [
+        (os.path.join(args.output_dir, 'models', file_name),
+         generate_model(args.resource, parsed_fields).encode('utf-8')),
+        (os.path.join(args.output_dir, 'schemas', file_name),
+         generate_schema(args.resource, parsed_fields).encode('utf-8')),
+        (os.path.join(args.output_dir, 'crud', file_name),
+         generate_crud_functions(args.resource, parsed_fields).encode('utf-8')),
+        (os.path.join(args.output_dir, 'routes', file_name),
+         generate_routes(args.resource, parsed_fields).encode('utf-8')),
+    ]
+
+    for path, data in files:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb', buffering=0) as f:
+            f.write(data)
 
     print(f"Generated CRUD endpoints for '{args.resource}' with fields: {args.fields}")
     print(f"Files created in {args.output_dir}/:")
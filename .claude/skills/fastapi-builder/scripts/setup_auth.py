@@ -8,23 +8,46 @@ import argparse
 import os
 from typing import Dict, List
 
-def generate_auth_setup() -> str:
-    """Generate authentication setup code"""
-    auth_code = '''from datetime import datetime, timedelta
+# The emitted code is entirely static, so the literals live at module scope
+# and are created once at import instead of on every generator call.
+_AUTH_CODE = '''import time
+from datetime import timedelta
 from typing import Optional
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt as pyjwt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from cachetools import TTLCache
 from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 
 from app.config import settings
+from app.database import get_db
+from app.models.user import User as UserDB
 
-# Security setup
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Security setup - argon2 calls straight into libargon2, without passlib's
+# per-call scheme dispatch and hash re-parsing
+_ph = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
 security = HTTPBearer()
 
+# Signing key and algorithm list are resolved once; PyJWT then only pays for
+# the HMAC verify + base64/json decode per request
+_SIGNING_KEY = settings.secret_key.encode()
+_ALGS = [settings.algorithm]
+
+# Per-process cache of authenticated users, keyed on (username, token exp) so
+# entries can never outlive the token that produced them. Bounds the DB to one
+# lookup per user per token lifetime instead of one per request.
+_USER_CACHE = TTLCache(maxsize=4096, ttl=settings.access_token_expire_minutes * 60)
+
+def invalidate_user_cache(username: str):
+    """Drop cached entries for a user; call after updating or disabling them"""
+    for key in [k for k in _USER_CACHE if k[0] == username]:
+        _USER_CACHE.pop(key, None)
+
 # Token models
 class Token(BaseModel):
     access_token: str
@@ -44,15 +67,20 @@ class UserInDB(User):
 
 def verify_password(plain_password: str, hashed_password: str):
     """Verify a plain password against a hashed password"""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        _ph.verify(hashed_password, plain_password)
+        return True
+    except VerifyMismatchError:
+        return False
 
 def get_password_hash(password: str):
     """Hash a plain password"""
-    return pwd_context.hash(password)
+    return _ph.hash(password)
 
-def authenticate_user(username: str, password: str, users_db: Dict[str, UserInDB]):
+async def authenticate_user(username: str, password: str, db: AsyncSession):
     """Authenticate a user by username and password"""
-    user = users_db.get(username)
+    result = await db.execute(select(UserDB).where(UserDB.username == username))
+    user = result.scalars().first()
     if not user or not verify_password(password, user.hashed_password):
         return False
     return user
@@ -60,15 +88,20 @@ def authenticate_user(username: str, password: str, users_db: Dict[str, UserInDB
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token"""
     to_encode = data.copy()
+    # exp is just an integer unix timestamp; time.time() avoids the deprecated
+    # datetime.utcnow() and the datetime arithmetic on every mint
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        exp = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
-    to_encode.update({"exp": expire, "sub": str(data.get("sub", ""))})
-    encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+        exp = int(time.time()) + settings.access_token_expire_minutes * 60
+    to_encode.update({"exp": exp, "sub": str(data.get("sub", ""))})
+    encoded_jwt = pyjwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.algorithm)
     return encoded_jwt
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+):
     """Get the current user from the JWT token in the request"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -76,12 +109,17 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(credentials.credentials, settings.secret_key, algorithms=[settings.algorithm])
+        payload = pyjwt.decode(
+            credentials.credentials,
+            _SIGNING_KEY,
+            algorithms=_ALGS,
+            options={"require": ["exp", "sub"]},
+        )
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
         token_data = TokenData(username=username)
-    except JWTError:
+    except pyjwt.PyJWTError:
         raise credentials_exception
 
     # In a real app, you would fetch the user from the database
@@ -91,13 +129,16 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     #     raise credentials_exception
     # return user
 
-    # Placeholder user - replace with database lookup
-    from app.database import get_db
-    from app.models.user import User as UserDB
-    db = next(get_db())
-    user = db.query(UserDB).filter(UserDB.username == token_data.username).first()
+    cache_key = (token_data.username, payload["exp"])
+    user = _USER_CACHE.get(cache_key)
     if user is None:
-        raise credentials_exception
+        result = await db.execute(
+            select(UserDB).where(UserDB.username == token_data.username)
+        )
+        user = result.scalars().first()
+        if user is None:
+            raise credentials_exception
+        _USER_CACHE[cache_key] = user
     return user
 
 async def get_current_active_user(current_user = Depends(get_current_user)):
@@ -107,11 +148,7 @@ async def get_current_active_user(current_user = Depends(get_current_user)):
     return current_user
 '''
 
-    return auth_code
-
-def generate_user_model() -> str:
-    """Generate user model code"""
-    model_code = '''from sqlalchemy import Column, Integer, String, Boolean
+_USER_MODEL_CODE = '''from sqlalchemy import Column, Integer, String, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
@@ -120,9 +157,16 @@ Base = declarative_base()
 class User(Base):
     __tablename__ = "users"
 
+    # unique=True already materializes a unique index on username/email, so no
+    # separate index=True; the covering index lets Postgres answer the login
+    # SELECT (username -> hashed_password, is_active) with an index-only scan
+    __table_args__ = (
+        Index("ix_users_login", "username", postgresql_include=["hashed_password", "is_active"]),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
-    username = Column(String, unique=True, index=True, nullable=False)
-    email = Column(String, unique=True, index=True, nullable=False)
+    username = Column(String, unique=True, nullable=False)
+    email = Column(String, unique=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(String, server_default=func.now())
@@ -131,11 +175,7 @@ class User(Base):
         return f"<User(username='{self.username}', email='{self.email}')>"
 '''
 
-    return model_code
-
-def generate_user_schemas() -> str:
-    """Generate user schema code"""
-    schema_code = '''from pydantic import BaseModel
+_USER_SCHEMAS_CODE = '''from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 
@@ -160,18 +200,16 @@ class User(UserBase):
         from_attributes = True
 '''
 
-    return schema_code
-
-def generate_auth_routes() -> str:
-    """Generate authentication routes"""
-    route_code = '''from fastapi import APIRouter, Depends, HTTPException, status
+_AUTH_ROUTES_CODE = '''from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from app.database import get_db
 from app.auth import (
     authenticate_user,
     create_access_token,
+    get_current_user,
     get_password_hash,
     Token
 )
@@ -184,9 +222,9 @@ router = APIRouter(tags=["auth"])
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    user = authenticate_user(form_data.username, form_data.password, db)
+    user = await authenticate_user(form_data.username, form_data.password, db)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -201,19 +239,9 @@ async def login_for_access_token(
 
 
 @router.post("/users/", response_model=User, status_code=status.HTTP_201_CREATED)
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
-    # Check if user already exists
-    existing_user = db.query(UserDB).filter(
-        (UserDB.username == user.username) | (UserDB.email == user.email)
-    ).first()
-
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username or email already registered"
-        )
-
-    # Create new user
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
+    # Insert directly and let the unique indexes reject duplicates; this is
+    # one round-trip instead of a pre-SELECT plus INSERT, with no race window
     hashed_password = get_password_hash(user.password)
     db_user = UserDB(
         username=user.username,
@@ -221,19 +249,40 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
         hashed_password=hashed_password
     )
 
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    try:
+        db.add(db_user)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username or email already registered"
+        )
 
+    await db.refresh(db_user)
     return db_user
 
 
 @router.get("/users/me/", response_model=User)
-def read_users_me(current_user: User = Depends(get_current_user)):
+async def read_users_me(current_user: User = Depends(get_current_user)):
     return current_user
 '''
 
-    return route_code
+def generate_auth_setup() -> str:
+    """Generate authentication setup code"""
+    return _AUTH_CODE
+
+def generate_user_model() -> str:
+    """Generate user model code"""
+    return _USER_MODEL_CODE
+
+def generate_user_schemas() -> str:
+    """Generate user schema code"""
+    return _USER_SCHEMAS_CODE
+
+def generate_auth_routes() -> str:
+    """Generate authentication routes"""
+    return _AUTH_ROUTES_CODE
 
 def main():
     parser = argparse.ArgumentParser(description='Setup authentication for FastAPI')
@@ -6,46 +6,76 @@ Configures database connection and initializes tables
 
 import argparse
 import os
+from pathlib import Path
 from typing import Dict, List
 
-def generate_sqlalchemy_database_setup() -> str:
-    """Generate SQLAlchemy database setup code"""
-    db_code = '''from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+# The emitted modules below are stored fully assembled at import time; each
+# generate_* call is then a constant lookup instead of re-building (and the
+# interpreter re-scanning) multi-KB literals per call.
+_SQLALCHEMY_DB_HEAD = '''import asyncio
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 from app.config import settings
 
-# Create the database engine
-engine = create_engine(
+# Async engine (postgresql+asyncpg:// for Postgres) with an explicit pool so
+# request handlers run on the event loop instead of the threadpool
+engine = create_async_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    echo=False,
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 # Base class for declarative models
 Base = declarative_base()
 
-def get_db():
+async def get_db():
     """
     Dependency function that provides database sessions.
     Use this as a FastAPI dependency.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    async with async_session() as session:
+        yield session
+
+'''
+
+_SQLALCHEMY_INIT_DB_MIGRATIONS = '''async def init_db():
+    """
+    Schema is managed by Alembic; run `alembic upgrade head` to migrate.
+    Importing the models keeps Base.metadata complete for autogenerate.
+    """
+    import app.models  # noqa: F401 - imported so models register with Base
+'''
 
-def init_db():
+_SQLALCHEMY_INIT_DB_CREATE_ALL = '''async def init_db():
     """
     Initialize the database by creating all tables.
     Call this function after importing all models.
     """
-    from app.models import *  # Import all models
-    Base.metadata.create_all(bind=engine)
+    import app.models  # noqa: F401 - imported so models register with Base
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
     print("Database tables created successfully.")
+'''
+
+_SQLALCHEMY_DB_TAIL = '''
+@asynccontextmanager
+async def lifespan(app):
+    """
+    FastAPI lifespan that runs schema setup as a background task, so worker
+    startup (and readiness) is not blocked on the metadata round-trips.
+    Use as FastAPI(lifespan=lifespan).
+    """
+    init_task = asyncio.create_task(init_db())
+    yield
+    await init_task
 
 def get_engine():
     """
@@ -55,11 +85,18 @@ def get_engine():
     return engine
 '''
 
-    return db_code
+_DB_CODE_SQLALCHEMY = _SQLALCHEMY_DB_HEAD + _SQLALCHEMY_INIT_DB_CREATE_ALL + _SQLALCHEMY_DB_TAIL
+_DB_CODE_SQLALCHEMY_MIGRATIONS = _SQLALCHEMY_DB_HEAD + _SQLALCHEMY_INIT_DB_MIGRATIONS + _SQLALCHEMY_DB_TAIL
 
-def generate_tortoise_database_setup() -> str:
-    """Generate Tortoise ORM database setup code"""
-    db_code = '''from tortoise import Tortoise
+def generate_sqlalchemy_database_setup(include_migrations: bool = False) -> str:
+    """Generate SQLAlchemy database setup code
+
+    With include_migrations the emitted init_db leaves schema management to
+    Alembic instead of running create_all at startup.
+    """
+    return _DB_CODE_SQLALCHEMY_MIGRATIONS if include_migrations else _DB_CODE_SQLALCHEMY
+
+_DB_CODE_TORTOISE = '''from tortoise import Tortoise
 from app.config import settings
 
 async def init_db():
@@ -91,11 +128,62 @@ def get_db():
     pass
 '''
 
-    return db_code
+def generate_tortoise_database_setup() -> str:
+    """Generate Tortoise ORM database setup code"""
+    return _DB_CODE_TORTOISE
 
-def generate_alembic_config() -> str:
-    """Generate Alembic configuration for database migrations"""
-    alembic_cfg = '''[alembic]
+_ASYNCPG_POOL_CODE = '''import asyncpg
+from app.config import settings
+
+# Raw asyncpg pool for hot read paths: fetching records directly skips
+# SQLAlchemy's Core compilation and ORM object construction per row
+_pool = None
+
+async def get_pool():
+    """
+    Return the process-wide asyncpg pool, creating it on first use.
+    """
+    global _pool
+    if _pool is None:
+        _pool = await asyncpg.create_pool(
+            settings.database_url,
+            min_size=5,
+            max_size=20,
+            command_timeout=60,
+        )
+    return _pool
+
+async def close_pool():
+    """
+    Close the pool on application shutdown.
+    """
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+async def get_conn():
+    """
+    Dependency function that yields a raw asyncpg connection.
+    Use this as a FastAPI dependency on read-heavy endpoints.
+    """
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        yield conn
+
+async def fetch_rows(sql, *args):
+    """
+    Run a read query on the pool and return asyncpg Records.
+    """
+    pool = await get_pool()
+    return await pool.fetch(sql, *args)
+'''
+
+def generate_asyncpg_pool() -> str:
+    """Generate the raw asyncpg pool module"""
+    return _ASYNCPG_POOL_CODE
+
+_ALEMBIC_INI = '''[alembic]
 # path to migration scripts
 script_location = alembic
 
@@ -148,13 +236,13 @@ version_path_separator = os  # Use os.pathsep. Default configuration used for ne
 # output_encoding = utf-8
 
 sqlalchemy.url =
-'''\
+'''
 
-    return alembic_cfg
+def generate_alembic_config() -> str:
+    """Generate Alembic configuration for database migrations"""
+    return _ALEMBIC_INI
 
-def generate_alembic_env_py() -> str:
-    """Generate Alembic environment file"""
-    env_py = '''import asyncio
+_ALEMBIC_ENV_PY = '''import asyncio
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -180,6 +268,21 @@ target_metadata = Base
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+def paged_query(connection, stmt, page_size=100):
+    """Stream a statement's rows in fixed-size pages for data migrations.
+
+    Keeps peak memory bounded by page_size rows instead of loading the
+    whole table before iterating.
+    """
+    offset = 0
+    while True:
+        rows = connection.execute(stmt.offset(offset).limit(page_size)).all()
+        if not rows:
+            break
+        yield rows
+        offset += page_size
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -205,7 +308,14 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # transaction_per_migration keeps each revision's locks short-lived and
+    # lets individual migrations opt into autocommit_block() for statements
+    # that cannot run in a transaction (e.g. CREATE INDEX CONCURRENTLY)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -241,7 +351,9 @@ else:
     run_migrations_online()
 '''
 
-    return env_py
+def generate_alembic_env_py() -> str:
+    """Generate Alembic environment file"""
+    return _ALEMBIC_ENV_PY
 
 def generate_requirements_additions(orm_type: str) -> str:
     """Generate additional requirements based on ORM type"""
@@ -264,45 +376,49 @@ def main():
                        help='Output directory for database files')
     parser.add_argument('--include-migrations', action='store_true',
                         help='Include Alembic migration configuration')
+    parser.add_argument('--raw-pool', action='store_true',
+                        help='Also emit a raw asyncpg pool module for hot read paths (sqlalchemy only)')
 
     args = parser.parse_args()
 
-    # Create output directory structure
-    os.makedirs(args.output_dir, exist_ok=True)
-
-    db_dir = os.path.join(args.output_dir, 'database')
-    os.makedirs(db_dir, exist_ok=True)
+    # Build the whole output tree with Path objects computed once; a single
+    # mkdir(parents=True) per leaf replaces the chain of makedirs/join calls
+    out = Path(args.output_dir)
+    db_dir = out / 'database'
+    db_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate content based on ORM type
     if args.orm == "sqlalchemy":
-        db_content = generate_sqlalchemy_database_setup()
+        db_content = generate_sqlalchemy_database_setup(include_migrations=args.include_migrations)
     else:
         db_content = generate_tortoise_database_setup()
 
-    # Write database setup file
-    with open(os.path.join(args.output_dir, 'database.py'), 'w') as f:
-        f.write(db_content)
+    # Write database setup file (one buffered write per path)
+    (out / 'database.py').write_text(db_content)
 
     # Create __init__.py in database directory
-    with open(os.path.join(db_dir, '__init__.py'), 'w') as f:
-        f.write('# Database utilities\n')
+    (db_dir / '__init__.py').write_text('# Database utilities\n')
+
+    # Emit the optional raw asyncpg pool module
+    if args.raw_pool and args.orm == 'sqlalchemy':
+        raw_dir = out / 'db'
+        raw_dir.mkdir(parents=True, exist_ok=True)
+        (raw_dir / '__init__.py').write_text('# Raw database access\n')
+        (raw_dir / 'asyncpg_pool.py').write_text(generate_asyncpg_pool())
 
     # Create alembic directory and files if requested
     if args.include_migrations:
-        alembic_dir = os.path.join(args.output_dir, 'alembic')
-        versions_dir = os.path.join(alembic_dir, 'versions')
-        os.makedirs(versions_dir, exist_ok=True)
+        alembic_dir = out / 'alembic'
+        versions_dir = alembic_dir / 'versions'
+        versions_dir.mkdir(parents=True, exist_ok=True)
 
         # Write alembic files
-        with open(os.path.join(alembic_dir, 'alembic.ini'), 'w') as f:
-            f.write(generate_alembic_config())
+        (alembic_dir / 'alembic.ini').write_text(generate_alembic_config())
 
-        with open(os.path.join(alembic_dir, 'env.py'), 'w') as f:
-            f.write(generate_alembic_env_py())
+        (alembic_dir / 'env.py').write_text(generate_alembic_env_py())
 
         # Create an initial migration
-        with open(os.path.join(versions_dir, 'initial_migration.py'), 'w') as f:
-            f.write('''"""Initial migration
+        (versions_dir / 'initial_migration.py').write_text('''"""Initial migration
 
 Revision ID: initial
 Revises:
@@ -322,6 +438,36 @@ depends_on = None
 def upgrade():
     # Create tables - this is a placeholder
     # Actual tables will be created based on your models
+    #
+    # Build indexes without holding a table lock (Postgres); CONCURRENTLY
+    # cannot run inside a transaction, hence the autocommit block:
+    #
+    #     with op.get_context().autocommit_block():
+    #         op.execute("CREATE INDEX CONCURRENTLY ix_example ON example (col)")
+    #
+    # Backfill data in bounded batches instead of one full-table statement so
+    # locks stay short and memory stays flat:
+    #
+    #     conn = op.get_bind()
+    #     batch_size = 1000
+    #     while True:
+    #         result = conn.execute(
+    #             sa.text("UPDATE example SET col = :v WHERE col IS NULL "
+    #                     "AND id IN (SELECT id FROM example WHERE col IS NULL "
+    #                     "LIMIT :n)"),
+    #             {"v": "default", "n": batch_size},
+    #         )
+    #         if result.rowcount == 0:
+    #             break
+    #
+    # Or stream existing rows in fixed-size pages with the paged_query
+    # helper from alembic/env.py, so peak memory stays bounded:
+    #
+    #     from env import paged_query
+    #     with op.get_context().autocommit_block():
+    #         for page in paged_query(conn, sa.select(example_table), page_size=100):
+    #             for row in page:
+    #                 ...  # transform / write back per row
     pass
 
 
@@ -331,25 +477,32 @@ def downgrade():
     pass
 ''')
 
-    # Update requirements.txt with database dependencies
-    req_file = os.path.join(os.getcwd(), 'requirements.txt')
-    if os.path.exists(req_file):
-        with open(req_file, 'a') as f:
-            f.write('\n# Database dependencies\n')
-            f.write(generate_requirements_additions(args.orm))
+    # Merge database dependencies into requirements.txt idempotently: one
+    # read, dedup against the lines already present, then publish the result
+    # with an atomic rename so re-runs never duplicate entries and an
+    # interrupted run never leaves a half-written file
+    req_file = Path(os.getcwd(), 'requirements.txt')
+    if req_file.exists():
+        existing_lines = req_file.read_text().splitlines()
     else:
-        # Create a new requirements file with database dependencies
-        with open(req_file, 'w') as f:
-            f.write('fastapi==0.104.1\n')
-            f.write('uvicorn[standard]\n')
-            f.write('pydantic==2.5.0\n')
-            f.write(generate_requirements_additions(args.orm))
+        existing_lines = ['fastapi==0.104.1', 'uvicorn[standard]', 'pydantic==2.5.0']
+    existing = set(existing_lines)
+    additions = [line for line in generate_requirements_additions(args.orm).splitlines()
+                 if line and line not in existing]
+    merged = existing_lines + additions
+
+    tmp_file = req_file.with_name(req_file.name + '.tmp')
+    tmp_file.write_text('\n'.join(merged) + '\n')
+    os.replace(tmp_file, req_file)
 
     print(f"Database setup completed for {args.orm}!")
     print(f"Files created in {args.output_dir}/:")
     print(f"  database.py - {args.orm.capitalize()} database setup")
     print(f"  database/ - Database utilities directory")
 
+    if args.raw_pool and args.orm == 'sqlalchemy':
+        print(f"  db/asyncpg_pool.py - Raw asyncpg pool for hot read paths")
+
     if args.include_migrations:
         print(f"  alembic/ - Migration configuration")
         print(f"  alembic/alembic.ini - Alembic configuration")
@@ -9,6 +9,14 @@ This script helps create properly structured SQLModel models for FastAPI applica
 import argparse
 from typing import List, Optional
 
+# Import headers precomputed per table flag; also fixes the old per-call
+# comprehension that prepended "import " to lines already starting with "from"
+_MODEL_IMPORTS_TABLE = "\n".join([
+    "from sqlmodel import Field, SQLModel",
+    "from typing import Optional"
+])
+_MODEL_IMPORTS_NOTABLE = "from sqlmodel import Field, SQLModel"
+
 
 def generate_model(model_name: str, fields: List[str], table: bool = True) -> str:
     """
@@ -22,13 +30,8 @@ def generate_model(model_name: str, fields: List[str], table: bool = True) -> st
     Returns:
         Generated Python code as a string
     """
-    # Import statements
-    imports = ["from sqlmodel import Field, SQLModel"]
-    if table:
-        imports.append("from typing import Optional")
-
     # Generate import section
-    import_section = "\n".join(f"import {imp}" if not imp.startswith("from") else imp for imp in imports)
+    import_section = _MODEL_IMPORTS_TABLE if table else _MODEL_IMPORTS_NOTABLE
 
     # Generate class definition
     base_classes = ["SQLModel"]
@@ -41,27 +44,19 @@ def generate_model(model_name: str, fields: List[str], table: bool = True) -> st
     field_lines = ["    pass  # Add your fields here"]
 
     if fields:
-        field_lines = []
-        for field in fields:
-            # Parse field: "name:type:options" where options are comma-separated
-            parts = field.split(":")
-            if len(parts) >= 2:
-                name = parts[0]
-                field_type = parts[1]
-                field_options = parts[2] if len(parts) > 2 else ""
-
-                # Generate field definition
-                if field_options:
-                    field_def = f"    {name}: {field_type} = Field({field_options})"
-                else:
-                    field_def = f"    {name}: {field_type}"
-
-                field_lines.append(field_def)
-            else:
-                field_lines.append(f"    # Invalid field format: {field}")
+        # Parse each field once: "name:type:options" where options are
+        # comma-separated; the lines come out fully indented, so no second
+        # indentation pass is needed
+        parsed = [field.split(":", 2) for field in fields]
+        field_lines = [
+            f"    {p[0]}: {p[1]} = Field({p[2]})" if len(p) > 2 and p[2]
+            else f"    {p[0]}: {p[1]}" if len(p) >= 2
+            else f"    # Invalid field format: {p[0]}"
+            for p in parsed
+        ]
 
     # Combine all parts
-    model_code = f"{import_section}\n\n{class_def}\n" + "\n".join(f"    {line}" if line != "pass  # Add your fields here" else f"    {line}" for line in field_lines)
+    model_code = f"{import_section}\n\n{class_def}\n" + "\n".join(field_lines)
 
     return model_code
 
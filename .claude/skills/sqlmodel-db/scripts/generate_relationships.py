@@ -8,6 +8,12 @@ Generates SQLModel models with relationships between them.
 import argparse
 from typing import List, Optional
 
+# Static import header joined once at import time
+_RELATIONSHIP_IMPORTS = "\n".join([
+    "from sqlmodel import Field, SQLModel, Relationship",
+    "from typing import List, Optional"
+])
+
 
 def generate_relationship_models(
     parent_model: str,
@@ -34,19 +40,15 @@ def generate_relationship_models(
     parent_plural = parent_model.lower() + "s"
     child_plural = child_model.lower() + "s"
 
-    # Import statements
-    imports = [
-        "from sqlmodel import Field, SQLModel, Relationship",
-        "from typing import List, Optional"
-    ]
-
-    import_section = "\n".join(imports)
+    import_section = _RELATIONSHIP_IMPORTS
 
-    # Generate parent model
-    parent_model_code = f"""
+    # Generate parent model; collect lines in a list and join once instead of
+    # growing a string with += per field
+    parent_parts = [f"""
 class {parent_model}(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-"""
+"""]
+    parent_append = parent_parts.append
 
     # Add parent fields if provided
     if parent_fields:
@@ -54,19 +56,20 @@ class {parent_model}(SQLModel, table=True):
             parts = field.split(":")
             if len(parts) >= 2:
                 name, field_type = parts[0], parts[1]
-                parent_model_code += f"    {name}: {field_type}\n"
+                parent_append(f"    {name}: {field_type}\n")
 
     # Add relationship field based on relationship type
     if relationship_type == "one-to-many":
-        parent_model_code += f"    {child_plural}: List[\"{child_model}\"] = Relationship(back_populates=\"{parent_lower}\")\n"
+        parent_append(f"    {child_plural}: List[\"{child_model}\"] = Relationship(back_populates=\"{parent_lower}\")\n")
     elif relationship_type == "one-to-one":
-        parent_model_code += f"    {child_lower}: Optional[\"{child_model}\"] = Relationship(back_populates=\"{parent_lower}\")\n"
+        parent_append(f"    {child_lower}: Optional[\"{child_model}\"] = Relationship(back_populates=\"{parent_lower}\")\n")
 
     # Generate child model
-    child_model_code = f"""
+    child_parts = [f"""
 class {child_model}(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-"""
+"""]
+    child_append = child_parts.append
 
     # Add child fields if provided
     if child_fields:
@@ -79,22 +82,24 @@ class {child_model}(SQLModel, table=True):
                     fk_match = field_type.split("foreign_key=")
                     if len(fk_match) > 1:
                         fk_table = fk_match[1].split(")")[0]
-                        child_model_code += f"    {parent_lower}_id: Optional[int] = Field(default=None, foreign_key=\"{fk_table}\")\n"
+                        child_append(f"    {parent_lower}_id: Optional[int] = Field(default=None, foreign_key=\"{fk_table}\")\n")
                     else:
-                        child_model_code += f"    {name}: {field_type}\n"
+                        child_append(f"    {name}: {field_type}\n")
                 else:
-                    child_model_code += f"    {name}: {field_type}\n"
+                    child_append(f"    {name}: {field_type}\n")
     else:
         # Add foreign key by default for one-to-many relationships
         if relationship_type == "one-to-many":
-            child_model_code += f"    {parent_lower}_id: Optional[int] = Field(default=None, foreign_key=\"{parent_lower}.id\")\n"
+            child_append(f"    {parent_lower}_id: Optional[int] = Field(default=None, foreign_key=\"{parent_lower}.id\")\n")
 
     # Add back-reference relationship
     if relationship_type == "one-to-many":
-        child_model_code += f"    {parent_lower}: Optional[\"{parent_model}\"] = Relationship(back_populates=\"{child_plural}\")\n"
+        child_append(f"    {parent_lower}: Optional[\"{parent_model}\"] = Relationship(back_populates=\"{child_plural}\")\n")
     elif relationship_type == "one-to-one":
-        child_model_code += f"    {parent_lower}: Optional[\"{parent_model}\"] = Relationship(back_populates=\"{child_lower}\")\n"
+        child_append(f"    {parent_lower}: Optional[\"{parent_model}\"] = Relationship(back_populates=\"{child_lower}\")\n")
 
+    parent_model_code = "".join(parent_parts)
+    child_model_code = "".join(child_parts)
     full_code = f"{import_section}\n\n{parent_model_code}\n{child_model_code}\n"
     return full_code
 
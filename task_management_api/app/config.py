@@ -1,8 +1,13 @@
 import os
+from functools import cached_property
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
+    # Settings never change after startup; frozen lets pydantic skip
+    # revalidation and keeps the cached URLs below trustworthy
+    model_config = SettingsConfigDict(frozen=True)
+
     # Database settings - using the provided Neon connection string
     postgres_user: str = os.getenv("POSTGRES_USER", "neondb_owner")
     postgres_password: str = os.getenv("POSTGRES_PASSWORD", "npg_HGgtQjuWSI73")
@@ -11,10 +16,26 @@ class Settings(BaseSettings):
     postgres_db: str = os.getenv("POSTGRES_DB", "neondb")
     neon_branch: str = os.getenv("NEON_BRANCH", "main")
 
-    # Construct the database URL
-    @property
+    # TLS toward the database; set DB_SSLMODE=disable when pointing the app
+    # at a pooler that does not terminate TLS (see docker-compose.yml)
+    db_sslmode: str = os.getenv("DB_SSLMODE", "require")
+
+    # Construct the database URL once; a plain property would re-build the
+    # f-string on every access
+    @cached_property
     def database_url(self) -> str:
-        return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}?sslmode=require&channel_binding=require"
+        url = f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        if self.db_sslmode != "disable":
+            url += f"?sslmode={self.db_sslmode}&channel_binding=require"
+        return url
+
+    # SQL statement logging; keep off in production, logging every statement
+    # is a per-query cost on the hot path
+    sql_echo: bool = os.getenv("SQL_ECHO", "false").lower() == "true"
+
+    # Connection pool sizing, tunable per deployment
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", 20))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", 40))
 
     # For local development with SQLite fallback
     use_sqlite_fallback: bool = os.getenv("USE_SQLITE_FALLBACK", "false").lower() == "true"
@@ -1,94 +1,160 @@
-from sqlmodel import Session, select
-from app.models.task import Task, TaskCreate, TaskUpdate, PriorityLevel
-from datetime import datetime
+from pydantic import TypeAdapter
+from sqlmodel import delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import and_, case, lambda_stmt, or_
+from app.models.task import Task, TaskCreate, TaskUpdate, TaskResponse, PriorityLevel
+from datetime import datetime, timezone
 from typing import Optional, List
 
-def create_task(session: Session, task: TaskCreate) -> Task:
+_UTC = timezone.utc
+
+# Validates a whole page of rows in one pydantic-core pass; combined with the
+# column select below, list queries skip ORM instance construction entirely
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+
+_TASK_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.is_completed,
+    Task.priority,
+    Task.created_at,
+    Task.updated_at,
+)
+
+# Sort priority by urgency rather than the enum's alphabetic string order.
+# Compare against the enum members instead of raw strings so the expression
+# matches however the Enum column stores them (member names, not values)
+PRIORITY_ORDER = case(
+    (Task.priority == PriorityLevel.URGENT, 0),
+    (Task.priority == PriorityLevel.HIGH, 1),
+    (Task.priority == PriorityLevel.MEDIUM, 2),
+    (Task.priority == PriorityLevel.LOW, 3),
+)
+
+# Allow-listed sort columns; a dict probe replaces the per-request if/elif
+# ladder and unknown sort_by values fall back to created_at instead of
+# silently skipping the ORDER BY
+SORT_COLUMNS = {
+    "priority": PRIORITY_ORDER,
+    "title": Task.title,
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "is_completed": Task.is_completed,
+}
+
+async def create_task(session: AsyncSession, task: TaskCreate) -> Task:
     """Create a new task"""
     db_task = Task.model_validate(task)
     session.add(db_task)
-    session.commit()
-    session.refresh(db_task)
+    await session.commit()
+    await session.refresh(db_task)
     return db_task
 
-def get_task(session: Session, task_id: int) -> Optional[Task]:
+async def create_tasks(session: AsyncSession, tasks: List[TaskCreate]) -> List[Task]:
+    """Create a batch of tasks in one transaction (one flush, one commit)"""
+    db_tasks = [Task.model_validate(task) for task in tasks]
+    session.add_all(db_tasks)
+    await session.commit()
+    return db_tasks
+
+async def get_task(session: AsyncSession, task_id: int) -> Optional[Task]:
     """Get a task by ID"""
     statement = select(Task).where(Task.id == task_id)
-    return session.exec(statement).first()
+    result = await session.exec(statement)
+    return result.first()
 
-def get_tasks(
-    session: Session,
+async def get_tasks(
+    session: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     is_completed: Optional[bool] = None,
     priority: Optional[PriorityLevel] = None,
     sort_by: Optional[str] = "created_at",
-    sort_order: Optional[str] = "desc"
-) -> List[Task]:
-    """Get all tasks with pagination, filtering, and sorting"""
-    statement = select(Task)
+    sort_order: Optional[str] = "desc",
+    cursor_created_at: Optional[datetime] = None,
+    cursor_id: Optional[int] = None
+) -> List[TaskResponse]:
+    """Get all tasks with pagination, filtering, and sorting.
+
+    When both cursor values (the last row's created_at and id from the
+    previous page) are given, pagination seeks past them with an index range
+    scan instead of OFFSET-discarding skip rows, and results are ordered by
+    (created_at, id) so pages stay stable regardless of depth.
+
+    If Task ever grows relationships that this listing serializes, add
+    .options(selectinload(Task.<rel>)) here rather than relying on lazy
+    loads, which would issue one query per row.
+    """
+    # lambda_stmt caches the compiled SQL per lambda-structure, so repeated
+    # requests with the same filter/sort shape skip Core compilation and only
+    # swap bind-parameter values
+    statement = lambda_stmt(lambda: select(*_TASK_COLUMNS))
 
     # Apply filters
     if is_completed is not None:
-        statement = statement.where(Task.is_completed == is_completed)
+        statement += lambda s: s.where(Task.is_completed == is_completed)
 
     if priority is not None:
-        statement = statement.where(Task.priority == priority)
+        statement += lambda s: s.where(Task.priority == priority)
 
-    # Apply sorting
-    if sort_by == "priority":
-        if sort_order == "asc":
-            statement = statement.order_by(Task.priority)
-        else:
-            statement = statement.order_by(Task.priority.desc())
-    elif sort_by == "title":
+    # Apply sorting and pagination: keyset when a cursor is supplied
+    # (cursor implies the created_at ordering it encodes), OFFSET otherwise
+    if cursor_created_at is not None and cursor_id is not None:
+        # (created_at, id) row-value comparison spelled out with scalar
+        # comparisons so lambda_stmt can track the cursor values as binds
         if sort_order == "asc":
-            statement = statement.order_by(Task.title)
+            statement += lambda s: s.where(
+                or_(
+                    Task.created_at > cursor_created_at,
+                    and_(Task.created_at == cursor_created_at, Task.id > cursor_id),
+                )
+            ).order_by(Task.created_at.asc(), Task.id.asc())
         else:
-            statement = statement.order_by(Task.title.desc())
-    elif sort_by == "created_at":
-        if sort_order == "asc":
-            statement = statement.order_by(Task.created_at)
-        else:
-            statement = statement.order_by(Task.created_at.desc())
-    elif sort_by == "updated_at":
-        if sort_order == "asc":
-            statement = statement.order_by(Task.updated_at)
-        else:
-            statement = statement.order_by(Task.updated_at.desc())
-    elif sort_by == "is_completed":
-        if sort_order == "asc":
-            statement = statement.order_by(Task.is_completed)
-        else:
-            statement = statement.order_by(Task.is_completed.desc())
-
-    # Apply pagination
-    statement = statement.offset(skip).limit(limit)
-    return session.exec(statement).all()
+            statement += lambda s: s.where(
+                or_(
+                    Task.created_at < cursor_created_at,
+                    and_(Task.created_at == cursor_created_at, Task.id < cursor_id),
+                )
+            ).order_by(Task.created_at.desc(), Task.id.desc())
+        statement += lambda s: s.limit(limit)
+    else:
+        sort_column = SORT_COLUMNS.get(sort_by, Task.created_at)
+        order_expr = sort_column.asc() if sort_order == "asc" else sort_column.desc()
+        # column expressions aren't bind params; key the cache entry on the
+        # (sort_by, sort_order) values instead of closure analysis
+        statement = statement.add_criteria(
+            lambda s: s.order_by(order_expr),
+            track_on=(sort_by, sort_order),
+        )
+        statement += lambda s: s.offset(skip).limit(limit)
 
-def update_task(session: Session, task_id: int, task_update: TaskUpdate) -> Optional[Task]:
-    """Update a task by ID"""
-    db_task = get_task(session, task_id)
-    if not db_task:
-        return None
+    result = await session.exec(statement)
+    return TASK_LIST_ADAPTER.validate_python(result.mappings().all())
 
+async def update_task(session: AsyncSession, task_id: int, task_update: TaskUpdate) -> Optional[Task]:
+    """Update a task by ID in a single UPDATE ... RETURNING round-trip"""
     update_data = task_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_task, key, value)
+    update_data["updated_at"] = datetime.now(_UTC)
 
-    from datetime import datetime, timezone
-    db_task.updated_at = datetime.now(timezone.utc)
-    session.add(db_task)
-    session.commit()
-    session.refresh(db_task)
+    # synchronize_session=False skips the in-session attribute sync pass;
+    # the RETURNING row is the authoritative post-update state
+    statement = (
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**update_data)
+        .returning(Task)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.exec(statement)
+    db_task = result.scalars().first()
+    await session.commit()
     return db_task
 
-def delete_task(session: Session, task_id: int) -> bool:
-    """Delete a task by ID"""
-    db_task = get_task(session, task_id)
-    if not db_task:
-        return False
-
-    session.delete(db_task)
-    session.commit()
-    return True
\ No newline at end of file
+async def delete_task(session: AsyncSession, task_id: int) -> bool:
+    """Delete a task by ID in a single DELETE ... RETURNING round-trip"""
+    statement = delete(Task).where(Task.id == task_id).returning(Task.id)
+    result = await session.exec(statement)
+    deleted_id = result.first()
+    await session.commit()
+    return deleted_id is not None
@@ -1,19 +1,68 @@
-from sqlmodel import create_engine, SQLModel, Session
-from app.config import settings
-import os
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.config import Settings, settings
 
-# Use PostgreSQL if available, otherwise fallback to SQLite
-if settings.use_sqlite_fallback:
-    DATABASE_URL = settings.fallback_database_url
-else:
-    DATABASE_URL = settings.database_url
+def _pg_connect_args(settings: Settings) -> dict:
+    """asyncpg connection kwargs for the PostgreSQL engine.
 
-engine = create_engine(DATABASE_URL, echo=True)
+    SSL is requested here rather than via the URL: asyncpg does not
+    understand libpq query params, and forwarding sslmode/channel_binding
+    to connect() raises TypeError.
+    """
+    connect_args = {
+        # The Neon -pooler host runs PgBouncer in transaction mode, which is
+        # incompatible with asyncpg's prepared-statement caches
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+    }
+    if settings.db_sslmode != "disable":
+        connect_args["ssl"] = settings.db_sslmode
+    return connect_args
 
-def create_db_and_tables():
+def _build_engine(settings: Settings):
+    """Build the async engine for the configured database.
+
+    Uses PostgreSQL if available, otherwise falls back to SQLite. Async
+    engine: Postgres round-trips overlap on the event loop instead of each
+    request pinning a threadpool worker for its whole DB round-trip.
+    """
+    if settings.use_sqlite_fallback:
+        url = settings.fallback_database_url.replace("sqlite://", "sqlite+aiosqlite://")
+        return create_async_engine(
+            url, echo=settings.sql_echo, pool_pre_ping=True, query_cache_size=1200
+        )
+
+    # Strip the libpq query string before swapping in the asyncpg driver;
+    # its SSL intent is carried by connect_args instead
+    url = settings.database_url.partition("?")[0].replace(
+        "postgresql://", "postgresql+asyncpg://"
+    )
+    return create_async_engine(
+        url,
+        echo=settings.sql_echo,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=30,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        query_cache_size=1200,
+        connect_args=_pg_connect_args(settings),
+    )
+
+engine = _build_engine(settings)
+
+# autoflush=False: reads no longer trigger a flush check before every SELECT;
+# writes flush explicitly via commit
+SessionLocal = async_sessionmaker(
+    engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
+async def create_db_and_tables():
     """Create database tables"""
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
-def get_session():
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
+async def get_session():
+    async with SessionLocal() as session:
+        yield session
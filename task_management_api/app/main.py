@@ -1,21 +1,29 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.routes import tasks
 from app.database import engine, create_db_and_tables
 import uvicorn
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Opt-in schema creation for development; production deployments run
+    # Alembic migrations instead of paying the metadata round-trips on
+    # every worker boot
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        await create_db_and_tables()
+    yield
+
 app = FastAPI(
     title="Task Management API",
     description="A complete Task Management API with full CRUD operations",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Include the task routes
 app.include_router(tasks.router, prefix="/api/v1", tags=["tasks"])
 
-@app.on_event("startup")
-def startup_event():
-    create_db_and_tables()
-
 @app.get("/")
 async def root():
     return {"message": "Task Management API"}
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, text
 from typing import Optional
 from datetime import datetime, timezone
 from enum import Enum
@@ -19,6 +20,21 @@ class TaskBase(SQLModel):
     priority: PriorityLevel = Field(default=PriorityLevel.MEDIUM)
 
 class Task(TaskBase, table=True):
+    # Indexes matching the filter/sort columns get_tasks exposes; the
+    # composite covers the common filtered-and-sorted listing in one scan
+    __table_args__ = (
+        Index("ix_task_is_completed", "is_completed"),
+        Index("ix_task_priority", "priority"),
+        Index("ix_task_created_at_desc", text("created_at DESC")),
+        Index("ix_task_updated_at_desc", text("updated_at DESC")),
+        Index(
+            "ix_task_completed_priority_created",
+            "is_completed",
+            "priority",
+            text("created_at DESC"),
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=get_current_time)
     updated_at: datetime = Field(default_factory=get_current_time)
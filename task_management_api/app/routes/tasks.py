@@ -1,10 +1,13 @@
-from fastapi import APIRouter, HTTPException, Depends
-from sqlmodel import Session
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List, Literal, Optional
+from datetime import datetime
 from app.database import get_session
 from app.models.task import Task, TaskCreate, TaskUpdate, TaskResponse, PriorityLevel
 from app.crud.task import (
+    TASK_LIST_ADAPTER,
     create_task,
+    create_tasks,
     get_task,
     get_tasks,
     update_task,
@@ -14,57 +17,77 @@ from app.crud.task import (
 router = APIRouter()
 
 @router.post("/tasks/", response_model=TaskResponse, status_code=201)
-def create_new_task(task: TaskCreate, session: Session = Depends(get_session)):
+async def create_new_task(task: TaskCreate, session: AsyncSession = Depends(get_session)):
     """Create a new task"""
-    db_task = create_task(session, task)
+    db_task = await create_task(session, task)
     return db_task
 
+@router.post("/tasks/bulk", response_model=List[TaskResponse], status_code=201)
+async def create_tasks_bulk(tasks: List[TaskCreate], session: AsyncSession = Depends(get_session)):
+    """Create multiple tasks in a single transaction"""
+    db_tasks = await create_tasks(session, tasks)
+    return db_tasks
+
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
-def read_task(task_id: int, session: Session = Depends(get_session)):
+async def read_task(task_id: int, session: AsyncSession = Depends(get_session)):
     """Get a specific task by ID"""
-    db_task = get_task(session, task_id)
+    db_task = await get_task(session, task_id)
     if not db_task:
         raise HTTPException(status_code=404, detail="Task not found")
     return db_task
 
 @router.get("/tasks/", response_model=List[TaskResponse])
-def read_tasks(
-    skip: int = 0,
-    limit: int = 100,
+async def read_tasks(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
     is_completed: Optional[bool] = None,
     priority: Optional[PriorityLevel] = None,
-    sort_by: str = "created_at",
-    sort_order: str = "desc",
-    session: Session = Depends(get_session)
+    sort_by: Literal["created_at", "updated_at", "priority", "title", "is_completed"] = "created_at",
+    sort_order: Literal["asc", "desc"] = "desc",
+    cursor_created_at: Optional[datetime] = None,
+    cursor_id: Optional[int] = None,
+    session: AsyncSession = Depends(get_session)
 ):
-    """Get all tasks with pagination, filtering, and sorting"""
-    tasks = get_tasks(
+    """Get all tasks with pagination, filtering, and sorting.
+
+    Pass the last row's created_at and id as cursor_created_at/cursor_id to
+    page with a keyset seek instead of a deep OFFSET.
+    """
+    tasks = await get_tasks(
         session,
         skip=skip,
         limit=limit,
         is_completed=is_completed,
         priority=priority,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor_created_at=cursor_created_at,
+        cursor_id=cursor_id
+    )
+    # The rows were already validated in one TypeAdapter pass in the CRUD
+    # layer; returning a Response skips FastAPI's second response_model
+    # validation (the decorator keeps it for OpenAPI only)
+    return Response(
+        content=TASK_LIST_ADAPTER.dump_json(tasks),
+        media_type="application/json",
     )
-    return tasks
 
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
-def update_existing_task(
+async def update_existing_task(
     task_id: int,
     task_update: TaskUpdate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ):
     """Update an existing task"""
-    db_task = update_task(session, task_id, task_update)
+    db_task = await update_task(session, task_id, task_update)
     if not db_task:
         raise HTTPException(status_code=404, detail="Task not found")
     return db_task
 
 @router.delete("/tasks/{task_id}")
-def delete_existing_task(task_id: int, session: Session = Depends(get_session)):
+async def delete_existing_task(task_id: int, session: AsyncSession = Depends(get_session)):
     """Delete a task"""
-    success = delete_task(session, task_id)
+    success = await delete_task(session, task_id)
     if not success:
         raise HTTPException(status_code=404, detail="Task not found")
-    return {"message": "Task deleted successfully"}
\ No newline at end of file
+    return {"message": "Task deleted successfully"}
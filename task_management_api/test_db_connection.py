@@ -3,13 +3,14 @@
 Test script to verify Neon PostgreSQL connectivity
 """
 
+import argparse
 import os
 from sqlalchemy import text
 from sqlmodel import SQLModel, create_engine, Session
 from app.config import settings
 from app.models.task import Task
 
-def test_db_connection():
+def test_db_connection(echo: bool = False):
     print("Testing Neon PostgreSQL database connection...")
 
     # Use the configured database URL
@@ -18,7 +19,7 @@ def test_db_connection():
 
     try:
         # Create engine
-        engine = create_engine(DATABASE_URL, echo=True)
+        engine = create_engine(DATABASE_URL, echo=echo)
 
         # Test connection
         with engine.connect() as conn:
@@ -52,4 +53,7 @@ def test_db_connection():
         return False
 
 if __name__ == "__main__":
-    test_db_connection()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Verify Neon PostgreSQL connectivity")
+    parser.add_argument("--echo", action="store_true", help="Log every SQL statement")
+    args = parser.parse_args()
+    test_db_connection(echo=args.echo)
\ No newline at end of file
@@ -1,25 +1,39 @@
+import asyncio
 import pytest
 import os
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.database import get_session
 from app.config import settings
 
+async def _create_tables(engine):
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
 @pytest.fixture(name="session")
 def session_fixture():
-    # Use in-memory SQLite for tests to keep them fast
-    engine = create_engine(
-        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    # Use async in-memory SQLite for tests to keep them fast. Tables are
+    # created once here, so the session is usable with or without the client
+    # fixture; aiosqlite binds its futures to the running loop per call, so
+    # the StaticPool connection can be shared with the client's event loop.
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
     )
-    SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
-        yield session
+    asyncio.run(_create_tables(engine))
+    # expire_on_commit=False mirrors the app's session factory so committed
+    # instances stay readable during response serialization
+    session = AsyncSession(engine, expire_on_commit=False)
+    yield session
+    asyncio.run(session.close())
+    asyncio.run(engine.dispose())
 
 @pytest.fixture(name="client")
 def client_fixture(session):
-    def get_session_override():
+    async def get_session_override():
         yield session
 
     app.dependency_overrides[get_session] = get_session_override
@@ -42,4 +56,4 @@ def postgres_session_fixture():
 
     SQLModel.metadata.create_all(engine)
     with Session(engine) as session:
-        yield session
\ No newline at end of file
+        yield session
@@ -0,0 +1,35 @@
+from app.config import Settings
+from app.database import _build_engine, _pg_connect_args
+
+
+def test_postgres_engine_url_has_no_libpq_params():
+    """Test that the asyncpg URL carries no libpq query params"""
+    engine = _build_engine(Settings(use_sqlite_fallback=False))
+
+    assert engine.url.drivername == "postgresql+asyncpg"
+    assert "sslmode" not in engine.url.query
+    assert "channel_binding" not in engine.url.query
+
+    # asyncpg raises TypeError on connect() for unknown kwargs, so nothing
+    # from the URL may leak libpq-only parameters into the connect call
+    _, connect_kwargs = engine.dialect.create_connect_args(engine.url)
+    assert "sslmode" not in connect_kwargs
+    assert "channel_binding" not in connect_kwargs
+
+
+def test_postgres_connect_args_request_ssl():
+    """Test that SSL is requested via connect_args instead of the URL"""
+    connect_args = _pg_connect_args(Settings(use_sqlite_fallback=False))
+
+    assert connect_args["ssl"] == "require"
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+
+
+def test_sslmode_disable_drops_ssl_everywhere():
+    """Test that DB_SSLMODE=disable yields a plain connection for PgBouncer"""
+    settings = Settings(use_sqlite_fallback=False, db_sslmode="disable")
+
+    assert "sslmode" not in settings.database_url
+    assert "channel_binding" not in settings.database_url
+    assert "ssl" not in _pg_connect_args(settings)
@@ -1,25 +1,24 @@
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine
-from app.main import app
-from app.database import engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import StaticPool
+from app.main import app
 
 # Create an in-memory database for testing
-test_engine = create_engine(
-    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+test_engine = create_async_engine(
+    "sqlite+aiosqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
 )
 
-def get_test_session():
-    SQLModel.metadata.create_all(test_engine)
-    with Session(test_engine) as session:
-        yield session
-
 # Override the dependency
 from app.routes import tasks
 from app.database import get_session
 
-def override_get_session():
-    yield next(get_test_session())
+async def override_get_session():
+    async with test_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        yield session
 
 app.dependency_overrides[get_session] = override_get_session
 
@@ -28,4 +27,4 @@ client = TestClient(app)
 def test_root():
     response = client.get("/")
     assert response.status_code == 200
-    assert response.json() == {"message": "Task Management API"}
\ No newline at end of file
+    assert response.json() == {"message": "Task Management API"}
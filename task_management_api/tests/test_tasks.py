@@ -158,6 +158,95 @@ def test_delete_nonexistent_task(client):
     assert response.json() == {"detail": "Task not found"}
 
 
+def test_bulk_create_tasks(client, session):
+    """Test creating multiple tasks in one request"""
+    tasks_data = [
+        {
+            "title": "Bulk Task One",
+            "description": "First bulk task",
+            "is_completed": False
+        },
+        {
+            "title": "Bulk Task Two",
+            "description": "Second bulk task",
+            "is_completed": True,
+            "priority": "high"
+        }
+    ]
+
+    response = client.post("/api/v1/tasks/bulk", json=tasks_data)
+    assert response.status_code == 201
+
+    data = response.json()
+    assert len(data) == 2
+
+    titles = [task["title"] for task in data]
+    assert "Bulk Task One" in titles
+    assert "Bulk Task Two" in titles
+
+    for task in data:
+        assert "id" in task
+        assert "created_at" in task
+
+
+def test_keyset_pagination(client, session):
+    """Test paging with a created_at/id cursor instead of offset"""
+    for i in range(3):
+        client.post("/api/v1/tasks/", json={
+            "title": f"Cursor Task {i}",
+            "description": "Task for cursor pagination",
+            "is_completed": False
+        })
+
+    first_page = client.get("/api/v1/tasks/?limit=2").json()
+    assert len(first_page) == 2
+
+    last_row = first_page[-1]
+    response = client.get(
+        "/api/v1/tasks/",
+        params={
+            "limit": 2,
+            "cursor_created_at": last_row["created_at"],
+            "cursor_id": last_row["id"],
+        },
+    )
+    assert response.status_code == 200
+
+    second_page = response.json()
+    assert len(second_page) >= 1
+    first_ids = {task["id"] for task in first_page}
+    assert all(task["id"] not in first_ids for task in second_page)
+
+
+def test_list_tasks_statement_count(client, session):
+    """Listing tasks should execute exactly one SELECT"""
+    from sqlalchemy import event
+
+    for i in range(3):
+        client.post("/api/v1/tasks/", json={
+            "title": f"Counted Task {i}",
+            "description": "Task for statement counting",
+            "is_completed": False
+        })
+
+    selects = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    sync_engine = session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.get("/api/v1/tasks/")
+        assert response.status_code == 200
+        assert len(response.json()) >= 3
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(selects) == 1
+
+
 def test_create_task_with_priority(client, session):
     """Test creating a task with priority"""
     task_data = {
@@ -270,6 +359,28 @@ def test_sort_tasks_by_priority(client, session):
     assert "high" in priorities_desc
 
 
+def test_sort_tasks_by_urgency_order(client, session):
+    """Test that priority sorting orders by urgency, not alphabetically"""
+    # Create one task per priority, in an order that matches neither
+    # alphabetic nor urgency order
+    for priority in ["medium", "urgent", "low", "high"]:
+        client.post("/api/v1/tasks/", json={
+            "title": f"{priority.capitalize()} Priority Task",
+            "description": f"{priority} priority task",
+            "is_completed": False,
+            "priority": priority
+        })
+
+    # Ascending runs most-urgent first
+    response = client.get("/api/v1/tasks/?sort_by=priority&sort_order=asc")
+    priorities = [task["priority"] for task in response.json()]
+    assert priorities == ["urgent", "high", "medium", "low"]
+
+    response = client.get("/api/v1/tasks/?sort_by=priority&sort_order=desc")
+    priorities = [task["priority"] for task in response.json()]
+    assert priorities == ["low", "medium", "high", "urgent"]
+
+
 def test_sort_tasks_by_title(client, session):
     """Test sorting tasks by title"""
     # Create tasks with different titles